@@ -1,4 +1,34 @@
-from .driver import *
-from .dom import *
-from .performance import *
-from .profile import *
+import importlib
+
+from . import driver as _driver
+
+# Lazy top-level namespace: names resolve to their subpackage on first
+# access so importing pylibselenium stays cheap (see driver/__init__.py).
+_LAZY = {name: "driver" for name in _driver.__all__}
+_LAZY.update(
+    {
+        "CachedElement": "dom",
+        "LocatedWebElement": "dom",
+        "clear_locator_cache": "dom",
+        "Measure": "performance",
+        "MeasureSequence": "performance",
+        "PerformanceClient": "performance",
+        "ProfileClient": "profile",
+    }
+)
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,2 +1,2 @@
 from .cachedelement import CachedElement
-from .locatedwebelement import LocatedWebElement
+from .locatedwebelement import LocatedWebElement, clear_locator_cache
@@ -1 +1 @@
-from .locatedwebelement import LocatedWebElement
+from .locatedwebelement import LocatedWebElement, clear_locator_cache
@@ -1,10 +1,194 @@
+import logging
+import sys
+import types
+import weakref
+from functools import lru_cache
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+logger = logging.getLogger(__name__)
+
+_VALID_BY = {
+    By.ID,
+    By.XPATH,
+    By.LINK_TEXT,
+    By.PARTIAL_LINK_TEXT,
+    By.NAME,
+    By.TAG_NAME,
+    By.CLASS_NAME,
+    By.CSS_SELECTOR,
+}
+
+
+@lru_cache(maxsize=512)
+def _normalize_locator(by, value):
+    if by not in _VALID_BY:
+        # Appium strategies and other extensions pass through untouched
+        return (by, sys.intern(str(value)))
+    # Only outer whitespace is safe to drop: collapsing runs inside the
+    # selector would also rewrite quoted XPath string literals (e.g.
+    # text()='Sign   in') and change what they match. Interning dedupes
+    # the selector strings page-objects reuse across thousands of finds.
+    return (by, sys.intern(str(value).strip()))
+
+
+def clear_locator_cache():
+    _normalize_locator.cache_clear()
+
+
+_BULK_FIND_JS = """
+const locators = arguments[0];
+const resolve = (by, value) => {
+    if (by === 'css selector') {
+        return Array.from(document.querySelectorAll(value));
+    }
+    if (by === 'id') {
+        const el = document.getElementById(value);
+        return el ? [el] : [];
+    }
+    if (by === 'name') {
+        return Array.from(document.getElementsByName(value));
+    }
+    if (by === 'tag name') {
+        return Array.from(document.getElementsByTagName(value));
+    }
+    if (by === 'class name') {
+        return Array.from(document.getElementsByClassName(value));
+    }
+    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+    }
+    return nodes;
+};
+return locators.map(l => resolve(l[0], l[1]));
+"""
+
+_GATHER_ATTRS_JS = """
+const pairs = arguments[0];
+return pairs.map(pair => {
+    const el = pair[0];
+    const out = {};
+    for (const name of pair[1]) {
+        out[name] = name === 'text' ? el.innerText : el.getAttribute(name);
+    }
+    return out;
+});
+"""
+
 
 class LocatedWebElement(WebElement):
-    def __init__(self, parent, id_, locator: tuple):
+    # WebElement carries no __slots__, so instances still get the inherited
+    # __dict__ (and weakref support); the slots keep our own attributes out
+    # of it.
+    __slots__ = ("locator", "_normalized", "cache_lookup", "_cached_ref")
+
+    # Dedupe instances per (parent, element id): re-finding the same DOM
+    # node hands back the live wrapper instead of allocating a new one.
+    _POOL = weakref.WeakValueDictionary()
+
+    def __new__(cls, parent, id_, locator: tuple, cache_lookup: bool = False):
+        key = (id(parent), id_)
+        cached = cls._POOL.get(key)
+        if cached is not None:
+            if getattr(cached, "locator", locator) != locator:
+                logger.debug(
+                    "locator changed for pooled element %s; skipping pool", id_)
+                return super().__new__(cls)
+            return cached
+        instance = super().__new__(cls)
+        cls._POOL[key] = instance
+        return instance
+
+    def __init__(self, parent, id_, locator: tuple, cache_lookup: bool = False):
         super().__init__(parent, id_)
         self.locator = locator
+        self._normalized = _normalize_locator(*locator)
+        self.cache_lookup = cache_lookup
+        self._cached_ref = id_ if cache_lookup else None
 
     def get_locator(self):
         return self.locator
+
+    @classmethod
+    def bulk_find(cls, parent, locators: list):
+        """Resolve several locators in one execute_script round-trip.
+
+        Returns a list of LocatedWebElement lists aligned with the input
+        locators, each element preserving its originating tuple.
+        """
+        normalized = [_normalize_locator(*locator) for locator in locators]
+        results = parent.execute_script(_BULK_FIND_JS, [list(n) for n in normalized])
+        return [
+            [cls(parent, element.id, locator, cache_lookup=True) for element in found]
+            for locator, found in zip(locators, results)
+        ]
+
+    _SPECIALIZED = {}
+
+    @classmethod
+    def specialize(cls, locator: tuple) -> type:
+        """Generate (and cache) a subclass bound to a fixed locator, for
+        page-objects whose locators are known at import time. Instances are
+        constructed as spec_cls(parent, id_) and all share one locator
+        tuple instead of carrying their own.
+        """
+        cached = cls._SPECIALIZED.get(locator)
+        if cached is not None:
+            return cached
+
+        shared = _normalize_locator(*locator)
+
+        def __init__(self, parent, id_, cache_lookup: bool = False):
+            cls.__init__(self, parent, id_, shared, cache_lookup)
+
+        def __new__(spec_cls, parent, id_, cache_lookup: bool = False):
+            return cls.__new__(spec_cls, parent, id_, shared, cache_lookup)
+
+        def exec_body(namespace):
+            namespace["__slots__"] = ()
+            namespace["__new__"] = __new__
+            namespace["__init__"] = __init__
+
+        specialized = types.new_class(
+            f"{cls.__name__}_{len(cls._SPECIALIZED)}", (cls,), exec_body=exec_body)
+        cls._SPECIALIZED[locator] = specialized
+        return specialized
+
+    @classmethod
+    def gather_attrs(cls, elements: list, attrs: list) -> list:
+        """Read several attributes from several elements in one
+        execute_script round-trip instead of one WebDriver command per
+        (element, attribute) pair.
+
+        'text' maps to innerText; everything else goes through
+        getAttribute. Returns a list of dicts aligned with the input
+        elements.
+        """
+        if not elements:
+            return []
+        names = list(attrs)
+        pairs = [[element, names] for element in elements]
+        return elements[0].parent.execute_script(_GATHER_ATTRS_JS, pairs)
+
+    def refind(self):
+        element = self.parent.find_element(*self._normalized)
+        self._id = element.id
+        if self.cache_lookup:
+            self._cached_ref = element.id
+        return self
+
+    def invalidate(self):
+        self._cached_ref = None
+
+    def with_retry_on_stale(self, action, *args, **kwargs):
+        try:
+            return action(*args, **kwargs)
+        except StaleElementReferenceException:
+            self.invalidate()
+            if self.cache_lookup:
+                self.refind()
+            return action(*args, **kwargs)
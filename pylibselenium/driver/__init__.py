@@ -1,10 +1,73 @@
-from .client import DriverClient, Error, AppiumClient
-from .delayer import DelayerMetaClass
-from .directory import Directory
-from .driverinterface import Chrome, DriverInterface, Firefox, RemoteWebdriver, Safari, Appium
-from .options import AppiumOptions, ChromeOptions, FirefoxOptions, SafariOptions
-from .preferences import FirefoxPreferences
-from .retry import retry, retry_until_successful
-from .services import ChromeService, FirefoxService, SafariService
-from .types import DROPDOWNTYPE, MODIFERKEYS
-from .wait import *
+import importlib
+
+# PEP 562 lazy loading: submodules (and the Selenium trees they pull in)
+# are only imported when one of their names is first accessed.
+_LAZY = {
+    "AppiumClient": "client",
+    "DriverClient": "client",
+    "Error": "client",
+    "DelayerMetaClass": "delayer",
+    "Directory": "directory",
+    "Appium": "driverinterface",
+    "Chrome": "driverinterface",
+    "DriverInterface": "driverinterface",
+    "Firefox": "driverinterface",
+    "RemoteWebdriver": "driverinterface",
+    "Safari": "driverinterface",
+    "AsyncAppium": "async_driverinterface",
+    "AsyncChrome": "async_driverinterface",
+    "AsyncDriverInterface": "async_driverinterface",
+    "AsyncDriverProxy": "async_driverinterface",
+    "AsyncFirefox": "async_driverinterface",
+    "AsyncRemoteWebdriver": "async_driverinterface",
+    "AsyncSafari": "async_driverinterface",
+    "AppiumOptions": "options",
+    "ChromeOptions": "options",
+    "FirefoxOptions": "options",
+    "SafariOptions": "options",
+    "FirefoxPreferences": "preferences",
+    "DriverPool": "pool",
+    "checkout": "pool",
+    "retry": "retry",
+    "retry_until_successful": "retry",
+    "ChromeService": "services",
+    "FirefoxService": "services",
+    "SafariService": "services",
+    "launch_shared_chrome": "shared_browser",
+    "DROPDOWNTYPE": "types",
+    "MODIFERKEYS": "types",
+    "AdaptiveWait": "wait",
+    "PresenceOfAllElementsLocatedIfNotEmpty": "wait",
+    "WaitElementToBeClickable": "wait",
+    "WaitForElementAfterClick": "wait",
+    "WaitForElementReadyState": "wait",
+    "WaitForElementToBeRemoved": "wait",
+    "WaitForElementToBeStale": "wait",
+    "WaitForHtmlLoadAfterClick": "wait",
+    "WaitForHtmlLoadAfterClickElement": "wait",
+    "WaitForKeysVerification": "wait",
+    "WaitForKeysVerificationWithDelay": "wait",
+    "WaitForLoadAfter": "wait",
+    "WaitForLoadAfterClick": "wait",
+    "WaitForPageLoad": "wait",
+    "WaitForValueToChange": "wait",
+    "WebDriverWait": "wait",
+    "WindowHandleToBeAvailable": "wait",
+    "WindowHandleToBeAvailableSwitchClosePrevious": "wait",
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,91 @@
+try:
+    import asyncio
+    import functools
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError as err:
+    print("Unable to import: {}".format(err))
+    exit()
+
+from .driverinterface import Appium, Chrome, DriverInterface, Firefox, RemoteWebdriver, Safari
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pylibselenium")
+
+
+class AsyncDriverProxy(object):
+    """Wraps a blocking WebDriver so every call runs in a thread pool.
+
+    Each method access returns a coroutine that submits the underlying
+    blocking call to the shared executor, so multiple drivers (or tabs)
+    can progress concurrently on one event loop.
+    """
+
+    def __init__(self, driver, pool: ThreadPoolExecutor = None) -> None:
+        self._driver = driver
+        self._pool = pool or _EXECUTOR
+
+    async def get(self, url: str):
+        return await self._run(self._driver.get, url)
+
+    async def find_element(self, by, value):
+        return await self._run(self._driver.find_element, by, value)
+
+    async def find_elements(self, by, value):
+        return await self._run(self._driver.find_elements, by, value)
+
+    async def execute_script(self, script, *args):
+        return await self._run(self._driver.execute_script, script, *args)
+
+    async def quit(self):
+        return await self._run(self._driver.quit)
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+
+    def __getattr__(self, name):
+        # Properties like current_url issue a WebDriver command the moment
+        # they are read, so resolving them on self._driver here would block
+        # the event loop. Route them through the executor as awaitables.
+        if isinstance(getattr(type(self._driver), name, None), property):
+            return self._run(getattr, self._driver, name)
+        attribute = getattr(self._driver, name)
+        if not callable(attribute):
+            return attribute
+
+        async def wrapped(*args, **kwargs):
+            return await self._run(attribute, *args, **kwargs)
+
+        return functools.wraps(attribute)(wrapped)
+
+
+class AsyncDriverInterface(DriverInterface):
+    """Async counterpart of DriverInterface backed by a sync interface."""
+
+    _sync_cls = None
+
+    def __init__(self, *args, pool: ThreadPoolExecutor = None, **kwargs) -> None:
+        self._interface = self._sync_cls(*args, **kwargs)
+        self._pool = pool or _EXECUTOR
+
+    def factory(self) -> AsyncDriverProxy:
+        return AsyncDriverProxy(self._interface.factory(), pool=self._pool)
+
+
+class AsyncChrome(AsyncDriverInterface):
+    _sync_cls = Chrome
+
+
+class AsyncFirefox(AsyncDriverInterface):
+    _sync_cls = Firefox
+
+
+class AsyncSafari(AsyncDriverInterface):
+    _sync_cls = Safari
+
+
+class AsyncRemoteWebdriver(AsyncDriverInterface):
+    _sync_cls = RemoteWebdriver
+
+
+class AsyncAppium(AsyncDriverInterface):
+    _sync_cls = Appium
@@ -5,21 +5,41 @@ from ..dom import CachedElement, LocatedWebElement
 from .delayer import DelayerMetaClass, delayed_function
 from .driverinterface import DriverInterface
 from .types import DROPDOWNTYPE, MODIFERKEYS
-from .wait import *
+from .wait import (
+    AdaptiveWait,
+    PresenceOfAllElementsLocatedIfNotEmpty,
+    WaitElementToBeClickable,
+    WaitForElementAfterClick,
+    WaitForElementToBeStale,
+    WaitForHtmlLoadAfterClick,
+    WaitForHtmlLoadAfterClickElement,
+    WaitForKeysVerification,
+    WaitForKeysVerificationWithDelay,
+    WaitForLoadAfterClick,
+    WaitForPageLoad,
+    WaitForValueToChange,
+    WindowHandleToBeAvailable,
+    WindowHandleToBeAvailableSwitchClosePrevious,
+)
 
 try:
+    import inspect
+    import json
     import logging
     import os
-    import pathlib
     import re
     import shutil
+    import sys
     from enum import Enum
-    from pathlib import Path
-    from platform import platform
-    from time import sleep
+    from functools import lru_cache, wraps
+    from time import monotonic, sleep
     from typing import Any
 
-    import psutil
+    from selenium.common.exceptions import (
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+        TimeoutException,
+    )
     from selenium.webdriver.common.action_chains import ActionChains
     from selenium.webdriver.common.by import By
     from selenium.webdriver.remote.webelement import WebElement
@@ -30,16 +50,363 @@ except ImportError as err:
     print(f"Unable to import: {err}")
     exit()
 
+logger = logging.getLogger(__name__)
+
+_LOG_CONFIGURED = False
+
+
+def _configure_logging():
+    """Attach the file handler on the first logged error rather than at
+    import or construction time, so no log file descriptor is opened (or
+    held for the process lifetime) unless an error is actually recorded."""
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED or logger.handlers:
+        return
+    from logging.handlers import RotatingFileHandler
+    # Pure string concat — no Path objects and no stat at configure time.
+    log_path = os.path.join(os.environ.get("TEMP", "/tmp"), "pylibselenium.log")
+    logger.addHandler(RotatingFileHandler(
+        log_path, maxBytes=10_000_000, backupCount=3, delay=True))
+    _LOG_CONFIGURED = True
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern):
+    """Compile (and cache) a regex so repeated property checks skip the
+    per-call re.compile."""
+    return re.compile(pattern)
+
+
+# Trivial xpaths of the form //tag[@attr='value'] translate 1:1 to CSS,
+# which browsers match with compiled selector lists instead of the XPath
+# evaluator. Backslashes are excluded from the value: CSS strings treat
+# them as escapes (\x matches x, not the literal), so those selectors
+# stay on the XPath path.
+_TRIVIAL_XPATH = re.compile(r"^//(\w+)\[@([\w-]+)='([^'\"\]\\]*)'\]$")
+
+
+@lru_cache(maxsize=512)
+def _locator(by, value):
+    """Return a cached (by, value) locator tuple so hot lookup paths reuse
+    one tuple per selector instead of allocating a fresh one per call.
+    Trivial single-attribute xpaths are opportunistically rewritten to the
+    equivalent (faster) CSS selector."""
+    if by == By.XPATH and (match := _TRIVIAL_XPATH.match(value)):
+        tag, attr, attr_value = match.groups()
+        return (By.CSS_SELECTOR, f"{tag}[{attr}='{attr_value}']")
+    return (by, value)
+
+
+# The expected-condition factories return stateless closures, so one cached
+# instance per locator serves every wait instead of allocating a fresh
+# closure on each call inside the polling hot loops.
+@lru_cache(maxsize=512)
+def _clickable(locator):
+    return EC.element_to_be_clickable(locator)
+
+
+@lru_cache(maxsize=512)
+def _present(locator):
+    return EC.presence_of_element_located(locator)
+
+
+@lru_cache(maxsize=512)
+def _all_present(locator):
+    return EC.presence_of_all_elements_located(locator)
+
 
 class Error(Exception):
     def __init__(self, text):
         self.text = text
 
 
+def _guarded(message):
+    """Shared try/except wrapper for the boilerplate error pattern: run the
+    method and, only when it fails (and errors are raised or logged), format
+    ``message`` lazily from the bound arguments plus ``err`` and route it
+    through check_throw. Errors check_throw raised inside the body pass
+    through untouched."""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Error:
+                raise
+            except Exception as err:
+                if self.throw or self.debug_mode:
+                    bound = signature.bind(self, *args, **kwargs)
+                    bound.apply_defaults()
+                    fields = dict(bound.arguments)
+                    fields["err"] = err
+                    self.check_throw(Error(message.format_map(fields)))
+        return wrapper
+    return decorator
+
+
+# Constant sources so the browser's script cache reuses the compiled
+# function across attribute mutations (see set/remove_attribute_of_node).
+_SET_ATTR_JS = "arguments[0].setAttribute(arguments[1], arguments[2]);"
+_REMOVE_ATTR_JS = "arguments[0].removeAttribute(arguments[1]);"
+
+# Installed once per navigation so element lookups can skip Selenium's W3C
+# locator dispatch and resolve directly in the page (see find_element_js).
+_FIND_HELPER_JS = (
+    "window.__pylib_find = (by, val) =>"
+    " by === 'css selector' ? document.querySelector(val)"
+    " : document.evaluate(val, document, null, 9, null).singleNodeValue;"
+)
+
+# Runs the whole scroll-to-bottom loop inside the browser: each iteration
+# scrolls, waits for the DOM to go quiet for 200ms (or the cap), and stops
+# early once the scrollHeight stops growing — one round-trip for the whole
+# loop instead of one per scroll (see scroll_to_bottom()).
+_SCROLL_JS = """
+const times = arguments[0];
+const cap = arguments[1] * 1000;
+const done = arguments[arguments.length - 1];
+const settle = () => new Promise(resolve => {
+    let last = Date.now();
+    const observer = new MutationObserver(() => { last = Date.now(); });
+    observer.observe(document.body, {childList: true, subtree: true});
+    const start = Date.now();
+    const timer = setInterval(() => {
+        if (Date.now() - last > 200 || Date.now() - start > cap) {
+            clearInterval(timer);
+            observer.disconnect();
+            resolve(true);
+        }
+    }, 50);
+});
+(async () => {
+    let height = document.body.scrollHeight;
+    for (let i = 0; i < times; i++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await settle();
+        const next = document.body.scrollHeight;
+        if (next === height) break;
+        height = next;
+    }
+    done(height);
+})();
+"""
+
+# Pinned user agent sent alongside the bot-shield payload.
+_BOT_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.53 Safari/537.36"
+
+# Single bot-detection shield registered once via
+# Page.addScriptToEvaluateOnNewDocument: navigator overrides plus canvas
+# noise in one payload, so no per-navigation execute_script round-trips.
+# __PLATFORM__ is substituted before registration.
+_BOT_SHIELD_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => false});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+Object.defineProperty(navigator, 'platform', {get: () => '__PLATFORM__'});
+Object.defineProperty(navigator, 'deviceMemory', {get: () => 8});
+(function () {
+    var overwrite = function (name) {
+        const OLD = HTMLCanvasElement.prototype[name];
+        Object.defineProperty(HTMLCanvasElement.prototype, name, {
+            "value": function () {
+                var r = Math.floor(Math.random() * 10) - 5,
+                    g = Math.floor(Math.random() * 10) - 5,
+                    b = Math.floor(Math.random() * 10) - 5,
+                    a = Math.floor(Math.random() * 10) - 5;
+                var context = this.getContext("2d");
+                var imageData = context.getImageData(0, 0, this.width, this.height);
+                const d = imageData.data;
+                for (let n = 0; n < d.length; n += 4) {
+                    d[n] += r;
+                    d[n + 1] += g;
+                    d[n + 2] += b;
+                    d[n + 3] += a;
+                }
+                context.putImageData(imageData, 0, 0);
+                return OLD.apply(this, arguments);
+            }
+        });
+    };
+    overwrite('toBlob');
+    overwrite('toDataURL');
+})();
+"""
+
+
+@lru_cache(maxsize=None)
+def _ua_payload():
+    return {"userAgent": _BOT_UA}
+
+
+@lru_cache(maxsize=None)
+def _bot_shield_payload(current_os):
+    return {"source": _BOT_SHIELD_JS.replace("__PLATFORM__", current_os)}
+
+# Polls inside the browser until every passed element is clickable
+# (attached, visible via offsetParent, not disabled) — one round-trip for
+# the whole batch instead of one wait per element (see get_elements()).
+_ALL_CLICKABLE_JS = """
+const els = arguments[0];
+const cap = arguments[1] * 1000;
+const done = arguments[arguments.length - 1];
+const start = Date.now();
+(function poll() {
+    if (els.every(e => e.offsetParent !== null && !e.disabled)) return done(true);
+    if (Date.now() - start > cap) return done(false);
+    setTimeout(poll, 50);
+})();
+"""
+
+# Evaluates every xpath in one script call and returns the textContent of
+# each first match (null when absent) — N text reads for one round-trip
+# (see get_texts_bulk()).
+_BULK_TEXTS_JS = """
+const xpaths = arguments[0];
+return xpaths.map(x => {
+    const node = document.evaluate(
+        x, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node ? node.textContent : null;
+});
+"""
+
+# Reads several fields off one XPath-located node in a single round-trip
+# instead of a get_attribute command per field (see get_node_snapshot()).
+_NODE_SNAPSHOT_JS = """
+const el = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!el) return null;
+const out = {};
+for (const field of arguments[1]) {
+    if (field === 'innerHTML') out[field] = el.innerHTML;
+    else if (field === 'outerHTML') out[field] = el.outerHTML;
+    else if (field === 'text') out[field] = el.innerText;
+    else out[field] = el.getAttribute(field);
+}
+return out;
+"""
+
+# Clicks every passed element in one script call instead of one
+# ActionChains round-trip per element (see click_all_elements_and_scroll()).
+_CLICK_ALL_JS = """
+for (const el of arguments[0]) {
+    el.scrollIntoView({block: 'center'});
+    el.click();
+}
+"""
+
+# Resolves true on the first mutation of the watched element (text,
+# children or attributes) and false once the cap elapses — the browser
+# pushes the change instead of Selenium polling for it (see
+# check_element_for_value_change()).
+_VALUE_CHANGE_JS = """
+const el = arguments[0];
+const cap = arguments[1] * 1000;
+const done = arguments[arguments.length - 1];
+const observer = new MutationObserver(() => {
+    observer.disconnect();
+    done(true);
+});
+observer.observe(el, {characterData: true, childList: true, attributes: true, subtree: true});
+setTimeout(() => { observer.disconnect(); done(false); }, cap);
+"""
+
+# Waits for the xpath, scrolls, clicks and navigates inside the browser so
+# the wait/click/go flow costs one execute_async_script call instead of six
+# serial commands (see find_click_and_send_keys_and_go()). Signals success
+# before assigning location so the callback is not lost to the navigation.
+_CLICK_AND_GO_JS = """
+const xpath = arguments[0];
+const url = arguments[1];
+const cap = arguments[2] * 1000;
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + cap;
+(function attempt() {
+    const el = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (el) {
+        el.scrollIntoView({block: 'center'});
+        el.click();
+        done(true);
+        window.location.href = url;
+        return;
+    }
+    if (Date.now() > deadline) {
+        done(false);
+        return;
+    }
+    setTimeout(attempt, 50);
+})();
+"""
+
+# Runs a whole click/fill/wait sequence inside the browser so N WebDriver
+# round-trips collapse into one execute_async_script call (see chain()).
+_CHAIN_JS = """
+const steps = arguments[0];
+const cap = arguments[1] * 1000;
+const done = arguments[arguments.length - 1];
+const find = xpath => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const waitFor = xpath => new Promise(resolve => {
+    const start = Date.now();
+    const probe = () => {
+        const el = find(xpath);
+        if (el) return resolve(true);
+        if (Date.now() - start > cap) return resolve(false);
+        setTimeout(probe, 50);
+    };
+    probe();
+});
+const settle = () => new Promise(resolve => {
+    let last = Date.now();
+    const observer = new MutationObserver(() => { last = Date.now(); });
+    observer.observe(document.body, {childList: true, subtree: true});
+    const start = Date.now();
+    const timer = setInterval(() => {
+        if (Date.now() - last > 200 || Date.now() - start > 1500) {
+            clearInterval(timer);
+            observer.disconnect();
+            resolve(true);
+        }
+    }, 50);
+});
+(async () => {
+    const results = [];
+    for (const step of steps) {
+        if (step.op === 'click') {
+            const el = find(step.xpath);
+            if (el) {
+                el.scrollIntoView({block: 'center'});
+                el.click();
+            }
+            results.push(Boolean(el));
+        } else if (step.op === 'fill') {
+            const el = find(step.xpath);
+            if (el) {
+                el.value = step.value;
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+            }
+            results.push(Boolean(el));
+        } else if (step.op === 'wait_for') {
+            results.push(await waitFor(step.xpath));
+        } else {
+            results.push(false);
+        }
+    }
+    await settle();
+    done(results);
+})();
+"""
+
+
 class DriverClient(object):
 
-    def __init__(self, driver: DriverInterface, poll_time: int = 10, poll_frequency: int = 1, scroll_pause_time: int = 5, debug_mode: bool = False, throw: bool = False,
-                 delete_profile: bool = False, close_previous_sessions: bool = False, action_delay: int = 0, disable_bot_detection_flag: bool = False, default_by: By = By.XPATH) -> None:
+    # Evaluated once at class-definition time; __setup only reads it.
+    _CURRENT_OS = "Win32" if sys.platform.startswith("win") else "MacIntel"
+
+    def __init__(self, driver: DriverInterface, poll_time: int = 10, poll_frequency: float = 0.1, scroll_pause_time: int = 5, debug_mode: bool = False, throw: bool = False,
+                 delete_profile: bool = False, close_previous_sessions: bool = False, action_delay: int = 0, disable_bot_detection_flag: bool = False, default_by: By = By.XPATH,
+                 use_js_finder: bool = False, implicit_wait: int = 0) -> None:
         """
         A client to interact with and manipulate web pages using Selenium.
 
@@ -49,8 +416,8 @@ class DriverClient(object):
             A Selenium WebDriver instance to interface with the browser.
         poll_time : int, optional
             Maximum time, in seconds, that the driver should wait when trying to find an element or elements if they are not immediately available, by default 10.
-        poll_frequency : int, optional
-            Sleep interval between calls, in seconds, by default 1.
+        poll_frequency : float, optional
+            Upper bound on the sleep interval between calls, in seconds, by default 0.1. Waits back off exponentially from 5ms up to this value.
         scroll_pause_time : int, optional
             Pause time, in seconds, between scroll actions, by default 5.
         debug_mode : bool, optional
@@ -67,6 +434,10 @@ class DriverClient(object):
             If True, executes various commands to obfuscate the webdriver, by default False.
         default_by : By, optional
             The default by locator strategy to use, by default By.XPATH
+        use_js_finder : bool, optional
+            If True, injects a JS find helper on navigation so find_element_js can resolve elements in one script call, by default False.
+        implicit_wait : int, optional
+            Server-side implicit wait, in seconds, applied once to the driver; finds return as soon as the element appears instead of blocking client-side, by default 0.
 
         Attributes
         ----------
@@ -78,8 +449,8 @@ class DriverClient(object):
             If True, the user profile used during the session will be deleted upon closing the driver.
         driver : DriverInterface
             A Selenium WebDriver instance to interface with the browser.
-        poll_frequency : int
-            Sleep interval between calls, in seconds.
+        poll_frequency : float
+            Upper bound on the sleep interval between calls, in seconds.
         poll_time : int
             Maximum time, in seconds, that the driver should wait when trying to find an element or elements if they are not immediately available.
         scroll_pause_time : int
@@ -102,104 +473,224 @@ class DriverClient(object):
         self.action_delay = action_delay
         self.disable_bot_detection_flag = disable_bot_detection_flag
         self.default_by = default_by
+        self.use_js_finder = use_js_finder
+        self.implicit_wait = implicit_wait
+        if implicit_wait:
+            # Set once; the server polls and returns the moment the element
+            # appears, unlike a fixed client-side delay per command.
+            self.driver.implicitly_wait(implicit_wait)
+        self._service_proc = None
+        self._wait = AdaptiveWait(
+            self.driver, self.poll_time, poll_frequency=self.poll_frequency)
+        self._custom_waits = {}
+        self._handles_cache = (0.0, None)
+        # Depth of the current frame focus; CDP probes evaluate in the top
+        # document only, so they are skipped whenever this is non-zero.
+        self._frame_depth = 0
+        # duration=0 skips the default 250ms pause W3C pointer actions
+        # insert between moves; chains must stay per-call since perform()
+        # does not clear queued actions.
+        self._actions = lambda: ActionChains(self.driver, duration=0)
+        if self.close_previous_sessions:
+            self._close_previous_sessions()
         self.__setup()
 
     def __del__(self) -> None:
 
         with contextlib.suppress(Exception):
-            if self.debug_mode == False:
+            if not self.debug_mode:
+                # Quit before touching the profile: the browser holds locks
+                # on the profile dir until it exits.
                 self.driver.quit()
                 self._kill_processes()
+                if self.delete_profile:
+                    self._delete_profile()
                 self.driver = None
 
+    def _get_service_process(self):
+        """
+        Return the cached psutil.Process for the driver's service, creating
+        it on first use once the service has a pid.
+        """
+        import psutil
+        if self._service_proc is None:
+            self._service_proc = psutil.Process(self.driver.service.process.pid)
+        return self._service_proc
+
     def _kill_processes(self):
         """
         Kill all processes associated with the driver's service.
 
         This method attempts to terminate all child processes spawned by the driver's service.
-        It does not raise exceptions but logs them if they occur.
-        """
+        It does not raise exceptions but logs them if they occur. On POSIX,
+        when the service was launched as its own process-group leader (the
+        services module passes start_new_session=True), the whole tree is
+        signalled with one os.killpg instead of enumerating processes.
+        """
+        if os.name == "posix":
+            with contextlib.suppress(Exception):
+                service_process = self.driver.service.process
+                pgid = os.getpgid(service_process.pid)
+                # Only when the service leads its own group — signalling a
+                # group we belong to would take this process down too.
+                if pgid == service_process.pid:
+                    import signal
+                    os.killpg(pgid, signal.SIGTERM)
+                    try:
+                        service_process.wait(timeout=3)
+                    except Exception:
+                        os.killpg(pgid, signal.SIGKILL)
+                    return
+        # psutil is only needed at teardown; importing here keeps it off the
+        # module import path (sys.modules makes repeat imports free).
+        import psutil
         with contextlib.suppress(Exception):
             if self.driver.service.process.pid:
-                pid = self.driver.service.process.pid
-                p = psutil.Process(pid)
-                children = p.children(recursive=True)
-                children.append(p)
-                for process in children:
-                    with contextlib.suppress(Exception):
+                parent = self._get_service_process()
+                # One process_iter pass builds a ppid index so the recursive
+                # walk never instantiates Process objects for unrelated pids.
+                children_by_ppid = {}
+                for process in psutil.process_iter(["pid", "ppid"]):
+                    children_by_ppid.setdefault(
+                        process.info["ppid"], []).append(process)
+                pending = [parent]
+                processes = []
+                while pending:
+                    current = pending.pop()
+                    processes.append(current)
+                    pending.extend(children_by_ppid.get(current.pid, []))
+                # Deepest-first so no process dies before its own children
+                # have been signalled (killing top-down orphans the
+                # grandchildren this method exists to clean up), and one
+                # wait_procs batches the grace period instead of paying a
+                # timeout per process.
+                children = processes[1:]
+                children.reverse()
+                for child in children:
+                    with contextlib.suppress(psutil.NoSuchProcess):
+                        child.terminate()
+                _, alive = psutil.wait_procs(children, timeout=3)
+                for child in alive:
+                    with contextlib.suppress(psutil.NoSuchProcess):
+                        child.kill()
+                with contextlib.suppress(psutil.NoSuchProcess):
+                    parent.terminate()
+                _, alive = psutil.wait_procs([parent], timeout=3)
+                for process in alive:
+                    with contextlib.suppress(psutil.NoSuchProcess):
                         process.kill()
 
+    def _close_previous_sessions(self):
+        """
+        Terminate browser and driver processes left over from previous
+        runs, sparing the tree owned by this client's own service.
+
+        One process_iter pass with prefetched attrs yields the candidates
+        and the ppid index; leftovers get a batched terminate plus
+        wait_procs, and survivors are killed.
+        """
+        import psutil
+        with contextlib.suppress(Exception):
+            targets = ("chromedriver", "chrome", "chrome.exe",
+                       "geckodriver", "firefox", "firefox.exe")
+            own = set()
+            with contextlib.suppress(Exception):
+                own.add(self.driver.service.process.pid)
+            candidates = []
+            children_by_ppid = {}
+            for process in psutil.process_iter(["pid", "ppid", "name"]):
+                children_by_ppid.setdefault(
+                    process.info["ppid"], []).append(process)
+                if (process.info["name"] or "").lower() in targets:
+                    candidates.append(process)
+            pending = list(own)
+            while pending:
+                for child in children_by_ppid.get(pending.pop(), []):
+                    if child.pid not in own:
+                        own.add(child.pid)
+                        pending.append(child.pid)
+            doomed = [p for p in candidates if p.pid not in own]
+            for process in doomed:
+                with contextlib.suppress(psutil.NoSuchProcess):
+                    process.terminate()
+            _, alive = psutil.wait_procs(doomed, timeout=3)
+            for process in alive:
+                with contextlib.suppress(psutil.NoSuchProcess):
+                    process.kill()
+
     def _delete_profile(self):
+        import tempfile
+        import threading
         with contextlib.suppress(Exception):
             browser_name = self.driver.capabilities['browserName']
             if browser_name == 'chrome':
                 data_dir = self.driver.capabilities['chrome']['userDataDir']
             elif browser_name == 'firefox':
                 data_dir = self.driver.capabilities['moz:profile']
-            shutil.rmtree(Path(data_dir).resolve())
+            # Rename first (atomic), then delete in the background so
+            # teardown doesn't block on walking a large profile tree. The
+            # holding dir lives beside the profile to stay on one
+            # filesystem; abspath is lexical, unlike Path.resolve().
+            data_dir = os.path.abspath(data_dir)
+            doomed = os.path.join(tempfile.mkdtemp(
+                prefix=".pylibselenium-rm-",
+                dir=os.path.dirname(data_dir)), "profile")
+            os.rename(data_dir, doomed)
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(os.path.dirname(doomed),),
+                kwargs={"ignore_errors": True},
+                daemon=True,
+            ).start()
 
     def __setup(self):
         try:
-            os_platform = {
-                "windows": "Win32",
-                "linux": "MacIntel"
-            }
-            current_os = os_platform['windows'] if 'windows' in platform(
-            ) else os_platform['linux']
             if self.disable_bot_detection_flag:
-                self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                    "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.53 Safari/537.36'})
-                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                    "source": "Object.defineProperty(navigator, 'webdriver', {get: ()=> false}), Object.defineProperty(navigator,'languages', {get: ()=> ['en-US', 'en']}), Object.defineProperty(navigator, 'platform', {get: () =>'MacIntel'}), Object.defineProperty(navigator, 'deviceMemory', {get: () => 8})"})
-                self.driver.execute_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => false})")
-                self.driver.execute_script("""
-                var inject = function () {
-                var overwrite = function (name) {
-                const OLD = HTMLCanvasElement.prototype[name];
-                Object.defineProperty(HTMLCanvasElement.prototype, name, {
-                    "value": function () {
-                    var shift = {
-                        'r': Math.floor(Math.random() * 10) - 5,
-                        'g': Math.floor(Math.random() * 10) - 5,
-                        'b': Math.floor(Math.random() * 10) - 5,
-                        'a': Math.floor(Math.random() * 10) - 5
-                    };
-                    var width = this.width, height = this.height, context = this.getContext("2d");
-                    var imageData = context.getImageData(0, 0, width, height);
-                    for (var i = 0; i < height; i++) {
-                        for (var j = 0; j < width; j++) {
-                        var n = ((i * (width * 4)) + (j * 4));
-                        imageData.data[n + \
-                            0] = imageData.data[n + 0] + shift.r;
-                        imageData.data[n + \
-                            1] = imageData.data[n + 1] + shift.g;
-                        imageData.data[n + \
-                            2] = imageData.data[n + 2] + shift.b;
-                        imageData.data[n + \
-                            3] = imageData.data[n + 3] + shift.a;
-                        }
-                    }
-                    context.putImageData(imageData, 0, 0);
-                    return OLD.apply(this, arguments);
-                    }
-                });
-                };
-                overwrite('toBlob');
-                overwrite('toDataURL');
-            };
-            inject();
-                """)
+                self.driver.execute_cdp_cmd(
+                    'Network.setUserAgentOverride', _ua_payload())
+                self.driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    _bot_shield_payload(self._CURRENT_OS))
         except Exception as err:
             print(err)
 
     def check_throw(self, error: Error) -> None:
-        logger.critical(f"Error: {error.text}")
-        traceback.print_exception(error)
+        # Suppressed lookup failures are the common case; only pay for
+        # handler setup and traceback formatting when debugging.
+        if self.debug_mode:
+            _configure_logging()
+            logger.critical(f"Error: {error.text}", exc_info=True)
         if self.throw:
             raise error
-        else:
-            pass
+
+    def _wait_for(self, timeout: int) -> AdaptiveWait:
+        """
+        Return a cached AdaptiveWait for a non-default timeout, so one-off
+        waits get the same backoff polling as self._wait without
+        reconstructing a wait object per call.
+        """
+        wait = self._custom_waits.get(timeout)
+        if wait is None:
+            wait = self._custom_waits[timeout] = AdaptiveWait(
+                self.driver, timeout, poll_frequency=self.poll_frequency)
+        return wait
+
+    # The three wait-on-default-locator lines repeated across the helpers,
+    # collapsed into one place (and one future batching point).
+    def _until_clickable(self, locator: str) -> WebElement:
+        return self._wait.until(_clickable(_locator(self.default_by, locator)))
+
+    def _until_present(self, locator: str) -> WebElement:
+        return self._wait.until(_present(_locator(self.default_by, locator)))
+
+    def _until_elements(self, locator: str) -> list:
+        return self._wait.until(_all_present(_locator(self.default_by, locator)))
+
+    def _report(self, err: Exception) -> None:
+        # Skip the f-string and Error allocation entirely when errors are
+        # neither raised nor logged — the common production configuration.
+        if self.throw or self.debug_mode:
+            self.check_throw(Error(f"ERROR: {err}."))
 
     def maximize_window(self):
         """
@@ -215,7 +706,7 @@ class DriverClient(object):
         try:
             self.driver.maximize_window()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def close(self) -> None:
         """
@@ -232,7 +723,7 @@ class DriverClient(object):
         try:
             self.driver.close()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def quit(self) -> None:
         """
@@ -244,7 +735,7 @@ class DriverClient(object):
         try:
             self.driver.quit()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def go(self, url: str) -> None:
         """
@@ -259,8 +750,12 @@ class DriverClient(object):
 
         try:
             self.driver.get(url)
+            # Navigation resets the session focus to the top-level context.
+            self._frame_depth = 0
+            if self.use_js_finder:
+                self.driver.execute_script(_FIND_HELPER_JS)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def go_and_wait_for_load(self, url: str) -> None:
         """
@@ -275,11 +770,12 @@ class DriverClient(object):
 
         try:
             self.driver.get(url)
-            WebDriverWait(
-                self.driver, self.poll_time, poll_frequency=self.poll_frequency
-            ).until(WaitForPageLoad())
+            self._frame_depth = 0
+            self._wait.until(WaitForPageLoad())
+            if self.use_js_finder:
+                self.driver.execute_script(_FIND_HELPER_JS)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def reload(self) -> None:
         """
@@ -292,7 +788,7 @@ class DriverClient(object):
         try:
             self.driver.refresh()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def scroll_to_top(self) -> None:
         """
@@ -305,7 +801,7 @@ class DriverClient(object):
         try:
             self.execute_script("window.scrollTo(0, 0);")
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def scroll_to_bottom(self, times: int) -> None:
         """
@@ -319,19 +815,22 @@ class DriverClient(object):
         """
 
         try:
-            browser_height = self.driver.execute_script(
-                "return document.body.scrollHeight")
-            for _ in range(times):
-                self.driver.execute_script(
-                    "window.scrollTo(0, document.body.scrollHeight);")
-                sleep(self.scroll_pause_time)
-                new_browser_height = self.driver.execute_script(
-                    "return document.body.scrollHeight")
-                if new_browser_height == browser_height:
-                    break
-                browser_height = new_browser_height
+            # The script holds the browser for up to times x pause, which
+            # can exceed Selenium's 30s default script timeout and abort
+            # the scroll midway. Widen the timeout to cover the worst case
+            # and restore it afterwards.
+            previous = self.driver.timeouts.script
+            needed = times * self.scroll_pause_time + 5
+            if needed > previous:
+                self.driver.set_script_timeout(needed)
+            try:
+                self.driver.execute_async_script(
+                    _SCROLL_JS, times, self.scroll_pause_time)
+            finally:
+                if needed > previous:
+                    self.driver.set_script_timeout(previous)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
             
     def scroll_to_bottom_watch_element_height(self, times: int, locator: str) -> None:
         """
@@ -345,19 +844,26 @@ class DriverClient(object):
         """
 
         try:
-            element_height = self.driver.execute_script(
-                f"return document.querySelector('{locator}').height")
+            height_js = "return document.querySelector(arguments[0]).height"
+            element_height = self.driver.execute_script(height_js, locator)
             for _ in range(times):
                 self.driver.execute_script(
                     "window.scrollTo(0, document.body.scrollHeight);")
-                sleep(self.scroll_pause_time)
-                new_element_height = self.driver.execute_script(
-                    f"return document.querySelector('{locator}').height")
-                if new_element_height == element_height:
+
+                # Return as soon as the element grows instead of padding
+                # every pass with the full scroll_pause_time; a timeout
+                # means no growth, i.e. the bottom was reached.
+                def height_grew(driver, _previous=element_height):
+                    new_height = driver.execute_script(height_js, locator)
+                    return new_height if new_height != _previous else False
+
+                try:
+                    element_height = self._wait_for(
+                        self.scroll_pause_time).until(height_grew)
+                except TimeoutException:
                     break
-                element_height = new_element_height
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
     def scroll_to_element(self, locator: str) -> None:
         """
         Scrolls to the element specified by the locator.
@@ -366,11 +872,11 @@ class DriverClient(object):
             locator (str): The locator of the element to scroll to.
         """
         try:
-            action = ActionChains(self.driver)
+            action = self._actions()
             action.scroll_to_element(locator)
             action.perform()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
         
     def open_new_tab(self) -> None:
         """
@@ -382,8 +888,9 @@ class DriverClient(object):
 
         try:
             self.execute_script("window.open();")
+            self._invalidate_window_handles()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def open_new_tab_go(self, url: str) -> None:
         """
@@ -398,9 +905,9 @@ class DriverClient(object):
 
         try:
             self.execute_script(
-                f"var newWindow = window.open(); newWindow.location.href = '{
-                    url}'"
+                f"var newWindow = window.open(); newWindow.location.href = '{url}'"
             )
+            self._invalidate_window_handles()
         except Exception as err:
             self.check_throw(
                 Error(f"Unable to open new tab to {url}. Error:{err}"))
@@ -419,7 +926,7 @@ class DriverClient(object):
         try:
             return self.execute_script("self.name")
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def switch_to_iframe(self, iframe: WebElement) -> None:
         """
@@ -434,8 +941,9 @@ class DriverClient(object):
 
         try:
             self.driver.switch_to.frame(iframe)
+            self._frame_depth += 1
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def switch_to_default_iframe(self) -> None:
         """
@@ -447,8 +955,9 @@ class DriverClient(object):
 
         try:
             self.driver.switch_to.default_content()
+            self._frame_depth = 0
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     ## ELEMENT FUNCTIONS ##
 
@@ -466,11 +975,11 @@ class DriverClient(object):
         """
 
         try:
-            action = ActionChains(self.driver)
+            action = self._actions()
             action.key_down(modifer_key).send_keys(keys).key_up(modifer_key)
             action.perform()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def press_modifer_key(self, modifer_key: MODIFERKEYS) -> None:
         """
@@ -484,11 +993,11 @@ class DriverClient(object):
         """
 
         try:
-            action = ActionChains(self.driver)
+            action = self._actions()
             action.key_down(modifer_key).key_up(modifer_key)
             action.perform()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def press_modifer_key_send_keys_on_element(
             self, element: WebElement, modifer_key: MODIFERKEYS, keys: Any = "") -> None:
@@ -505,12 +1014,12 @@ class DriverClient(object):
         """
 
         try:
-            action = ActionChains(self.driver)
+            action = self._actions()
             action.key_down(modifer_key, element).send_keys(
                 keys, element).key_up(modifer_key, element)
             action.perform()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def press_modifer_key_on_element(
             self, element: WebElement, modifer_key: MODIFERKEYS) -> None:
@@ -526,11 +1035,11 @@ class DriverClient(object):
         """
 
         try:
-            action = ActionChains(self.driver)
+            action = self._actions()
             action.key_down(modifer_key, element).key_up(modifer_key, element)
             action.perform()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_elements(self, locator: str) -> list[LocatedWebElement | CachedElement]:
         """
@@ -546,20 +1055,24 @@ class DriverClient(object):
 
         try:
             # Wait for all elements located by XPath to be present
-            elements = WebDriverWait(
-                self.driver, self.poll_time, poll_frequency=self.poll_frequency
-            ).until(EC.visibility_of_all_elements_located((self.default_by, locator)))
+            elements = self._wait.until(EC.visibility_of_all_elements_located(_locator(self.default_by, locator)))
 
-            # Wrap each element in the LocatedElement class
+            # Wrap each element in the LocatedElement class. The wrapper
+            # keeps the caller's tuple — the CSS rewrite from _locator is
+            # wire-only and must not leak through get_locator().
             wrapped_elements = [
-                LocatedWebElement(self.driver, element.id, (self.default_by, locator)) for element in elements
+                LocatedWebElement(self.driver, element.id, (self.default_by, locator), cache_lookup=True) for element in elements
             ]
 
-            # Ensure each element is clickable
-            for element in wrapped_elements:
-                WebDriverWait(
-                    self.driver, self.poll_time, poll_frequency=self.poll_frequency
-                ).until(EC.element_to_be_clickable(element))
+            # Ensure every element is clickable in a single browser-side
+            # poll rather than one wait loop per element
+            all_clickable = self.driver.execute_async_script(
+                _ALL_CLICKABLE_JS, elements, self.poll_time)
+            if not all_clickable:
+                self.check_throw(
+                    Error(
+                        f"Failed to find elements: {locator}. Error:elements did not become clickable within {self.poll_time}s"))
+                return None
             return wrapped_elements
 
         except Exception as err:
@@ -568,6 +1081,52 @@ class DriverClient(object):
                 Error(
                     f"Failed to find elements: {locator}. Error:{err}"))
 
+    def find_elements_batch(self, locators: list) -> list[list[LocatedWebElement]]:
+        """
+        Resolves several locator tuples in a single execute_script round-trip.
+
+        Args:
+            locators (list): A list of (by, value) locator tuples.
+
+        Returns:
+            list[list[LocatedWebElement]]: Found elements per locator, aligned with the input order.
+
+        Raises:
+            Error: If an exception occurs during the batch lookup.
+        """
+        try:
+            return LocatedWebElement.bulk_find(self.driver, locators)
+        except Exception as err:
+            self.check_throw(
+                Error(f"Failed to batch find elements: {locators}. Error:{err}"))
+
+    def find_element_js(self, locator: str) -> LocatedWebElement:
+        """
+        Resolves an element through the injected JS find helper in a single
+        script call, skipping Selenium's locator dispatch. Requires
+        use_js_finder=True so the helper was installed on navigation.
+
+        Args:
+            locator (str): The locator value, interpreted with default_by.
+
+        Returns:
+            LocatedWebElement: The located element, or None if not found.
+
+        Raises:
+            Error: If an exception occurs during the lookup.
+        """
+        try:
+            element = self.driver.execute_script(
+                "return window.__pylib_find(arguments[0], arguments[1]);",
+                self.default_by, locator)
+            if element is None:
+                return None
+            return LocatedWebElement(
+                self.driver, element.id, (self.default_by, locator), cache_lookup=True)
+        except Exception as err:
+            self.check_throw(
+                Error(f"Failed to find element: {locator}. Error:{err}"))
+
     def get_elements_until_none(self, locator: str) -> WebElement:
         """
         Waits until elements matching the given XPath are present and returns them.
@@ -582,9 +1141,11 @@ class DriverClient(object):
             Error: If an exception occurs during the element location process.
         """
         try:
-            elements = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                PresenceOfAllElementsLocatedIfNotEmpty((self.default_by, locator)))
-            return elements if type(elements) == list else False
+            elements = self._wait.until(
+                PresenceOfAllElementsLocatedIfNotEmpty(_locator(self.default_by, locator)))
+            # PresenceOfAllElementsLocatedIfNotEmpty only yields a non-empty
+            # list or False, so no type check is needed.
+            return elements or False
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find elements: {locator}. Error:{err}"))
@@ -619,9 +1180,7 @@ class DriverClient(object):
         """
 
         try:
-            return WebDriverWait(
-                self.driver, self.poll_time, poll_frequency=self.poll_frequency
-            ).until(EC.element_to_be_clickable((self.default_by, locator)))
+            return self._until_clickable(locator)
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find element: {locator}. Error:{err}"))
@@ -641,9 +1200,7 @@ class DriverClient(object):
         """
 
         try:
-            return WebDriverWait(
-                self.driver, self.poll_time, poll_frequency=self.poll_frequency
-            ).until(EC.element_to_be_clickable((self.default_by, locator)))
+            return self._until_clickable(locator)
         except Exception as err:
             return False
 
@@ -679,15 +1236,23 @@ class DriverClient(object):
         """
 
         try:
-            c_element = element.find_element(self.default_by, locator)
-            return WebDriverWait(
-                self.driver, self.poll_time, poll_frequency=self.poll_frequency
-            ).until(EC.element_to_be_clickable(c_element))
+            resolved = _locator(self.default_by, locator)
+
+            # One wait covers both stages: the find itself retries on the
+            # poll schedule (an eager find before the wait could raise
+            # NoSuchElement once and lose the retry) and each poll costs a
+            # single find plus the interactability probes.
+            def child_clickable(driver):
+                child = element.find_element(*resolved)
+                return child if child.is_displayed() and child.is_enabled() else False
+
+            return self._wait.until(child_clickable)
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find element: {locator}. Error:{err}"))
 
-    def find_and_send_modifer_key(self, locator: str, key: Any) -> None:
+    @_guarded("Failed to find element: {locator} and send keys: {key}")
+    def find_xpath_and_send_modifer_key(self, locator: str, key: Any) -> None:
         """
         Finds an element by XPath, waits for it to be clickable, and sends keys to it.
 
@@ -699,16 +1264,8 @@ class DriverClient(object):
             Error: If an exception occurs during the element location or key sending process.
         """
 
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            element.send_keys(key)
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and send keys: {key}")
-            )
+        element = self._until_clickable(locator)
+        element.send_keys(key)
 
     def find_and_send_modifer_key(
             self, element: WebElement, modifier_key: Any) -> None:
@@ -724,8 +1281,9 @@ class DriverClient(object):
         """
 
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located(element))
+            # The element is already located; the old
+            # presence_of_element_located(element) call expected a locator
+            # tuple and unconditionally raised, so every send was skipped.
             element.send_keys(modifier_key)
         except Exception as err:
             self.check_throw(
@@ -734,35 +1292,22 @@ class DriverClient(object):
             )
 
     def send_modifer_key(self, modifier_key) -> None:
-        try:
-            action = ActionChains(self.driver)
-            action.key_down(modifier_key).key_up(modifier_key)
-            action.perform()
-        except Exception as err:
-            traceback.print_exc()
+        # Kept as an alias; press_modifer_key carries the identical body.
+        self.press_modifer_key(modifier_key)
 
     def send_modifer_key_to_window(self, window, modifier_key) -> None:
-        try:
-            action = ActionChains(self.driver)
-            action.key_down(modifier_key, window).key_up(modifier_key, window)
-            action.perform()
-        except Exception as err:
-            traceback.print_exc()
+        # Kept as an alias; press_modifer_key_on_element carries the
+        # identical body (the window argument is an event target).
+        self.press_modifer_key_on_element(window, modifier_key)
 
+    @_guarded("Failed to find element: {locator} and send keys: {keys}. Error: {err}")
     def find_and_click_send_modifer_key(
             self, locator: str, modifer_key: Any, keys: Any) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            self.click_element(element)
-            self.press_modifer_key_send_keys(modifer_key, keys)
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and send keys: {keys}. Error: {err}")
-            )
+        element = self._until_clickable(locator)
+        self.click_element(element)
+        self.press_modifer_key_send_keys(modifer_key, keys)
 
+    @_guarded("Failed to find element: {locator} and send keys: {keys}. Error: {err}")
     def find_and_send_keys(self, locator: str, keys: Any) -> None:
         """
         Find an element by XPath, send keys to the element, and verify the keys sent.
@@ -781,16 +1326,11 @@ class DriverClient(object):
             None
         """
 
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForKeysVerification((self.default_by, locator), keys))
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and send keys: {keys}. Error: {err}")
-            )
+        self._until_clickable(locator)
+        self._wait.until(
+            WaitForKeysVerification(_locator(self.default_by, locator), keys))
 
+    @_guarded("Failed to find element: {locator} and send keys: {keys}. Error: {err}")
     def find_and_send_keys_with_delay(
             self, locator: str, keys: Any, delay=1) -> None:
         """
@@ -811,91 +1351,127 @@ class DriverClient(object):
         Returns:
             None
         """
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForKeysVerificationWithDelay((self.default_by, locator), keys, delay=1))
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and send keys: {keys}. Error: {err}")
-            )
+        self._until_clickable(locator)
+        self._wait.until(
+            WaitForKeysVerificationWithDelay(_locator(self.default_by, locator), keys, delay=1))
 
+    @_guarded("Failed to find element: {locator} and send keys: {keys}. Error: {err}")
     def find_click_and_send_keys(self, locator: str, keys: str) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            self.click_element(element)
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForKeysVerification((self.default_by, locator), keys))
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and send keys: {keys}. Error: {err}")
-            )
+        element = self._until_clickable(locator)
+        self.click_element(element)
+        # Hand the located element to the condition so each verification
+        # poll skips re-finding it by locator.
+        self._wait.until(WaitForKeysVerification(element, keys))
 
+    @_guarded("Failed to find element: {locator} and click.")
     def find_and_click(self, locator: str) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            self.click_element(element)
+        # element_to_be_clickable already implies presence; a separate
+        # presence wait would just double the worst-case poll time.
+        element = self._until_clickable(locator)
+        self.click_element(element)
+
+    def chain(self, steps: list[dict]) -> list:
+        """
+        Runs a sequence of steps inside the browser in one round-trip.
+
+        Each step is a dict such as {"op": "click", "xpath": ...},
+        {"op": "fill", "xpath": ..., "value": ...} or
+        {"op": "wait_for", "xpath": ...}. The browser performs the whole
+        sequence, waits for the DOM to settle (MutationObserver, 1.5s cap)
+        and returns one boolean per step.
+
+        Args:
+            steps (list[dict]): The steps to perform, in order.
+
+        Returns:
+            list: Per-step success flags, or None on failure.
 
+        Raises:
+            Error: If an exception occurs while running the chain.
+        """
+        try:
+            return self.driver.execute_async_script(
+                _CHAIN_JS, steps, self.poll_time)
         except Exception as err:
             self.check_throw(
-                Error(f"Failed to find element: {locator} and click."))
+                Error(f"Failed to run chain: {steps}. Error:{err}"))
 
     def find_and_click_and_wait_for_element(
             self, locator: str, element_locator: str) -> None:
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
+            if self.default_by == By.XPATH:
+                results = self.chain([
+                    {"op": "click", "xpath": locator},
+                    {"op": "wait_for", "xpath": element_locator},
+                ])
+                if results and all(results):
+                    return
+                if results and results[0]:
+                    # The click already ran in the browser; replaying it
+                    # through the fallback would double any side effect.
+                    # Keep waiting for the expected element instead.
+                    self._until_present(element_locator)
+                    return
+            element = self._until_clickable(locator)
             self.click_element(element)
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, element_locator)))
+            self._until_present(element_locator)
 
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find element: {locator} and click."))
 
+    @_guarded("Failed to find element: {locator} and click.")
     def find_click_and_send_keys_and_go(
             self, locator: str, keys: str, url: str) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
-            self.click_element(element)
-            self.driver.go(url)
-
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and click."))
+        if self.default_by == By.XPATH:
+            try:
+                if self.driver.execute_async_script(
+                        _CLICK_AND_GO_JS, locator, url, self.poll_time):
+                    return
+            except Exception:
+                pass
+        element = self._until_clickable(locator)
+        self.click_element(element)
+        self.driver.go(url)
 
     def click_element(self, element: WebElement) -> None:
         try:
-            action = ActionChains(self.driver)
-            action.scroll_to_element(element)
-            action.move_to_element(element)
-            action.click(element)
-            action.perform()
+            # One scripted scroll plus a native click is 2 round-trips; the
+            # ActionChains path costs 4 and is kept only as a fallback for
+            # elements an overlay intercepts.
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'});", element)
+            element.click()
+        except Exception:
+            try:
+                action = self._actions()
+                action.scroll_to_element(element)
+                action.move_to_element(element)
+                action.click(element)
+                action.perform()
+            except Exception as err:
+                self.check_throw(
+                    Error(f"Failed to find element: {element} and click."))
 
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {element} and click."))
+    def _click_with_bounded_retry(self, element: WebElement) -> None:
+        """
+        Clicks an element already known to be present, retrying once behind
+        a 1-second clickable wait if the click is intercepted or the element
+        is not yet interactable. Caps worst-case time at O(1) per element
+        instead of a full poll_time wait each.
+        """
+        try:
+            element.click()
+        except (ElementClickInterceptedException,
+                ElementNotInteractableException):
+            self._wait_for(1).until(
+                EC.element_to_be_clickable(element))
+            element.click()
 
     def try_to_click_element(self, element: WebElement) -> None:
         try:
             if element:
-                action = ActionChains(self.driver)
-                action.scroll_to_element(element)
-                action.move_to_element(element)
-                action.click(element)
-                action.perform()
+                self.click_element(element)
 
         except Exception as err:
             self.check_throw(
@@ -903,53 +1479,105 @@ class DriverClient(object):
 
     def click_chain_elements_infinitely(
             self, locators: list, pause_time: int = 0) -> None:
+        # Resolve the locator tuples once; the loop body reuses them on
+        # every pass instead of re-hashing the selector strings.
+        resolved = [_locator(self.default_by, locator) for locator in locators]
+        steps = ([{"op": "click", "xpath": locator} for locator in locators]
+                 if self.default_by == By.XPATH else None)
         while True:
             try:
-                for locator in locators:
-                    WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                        EC.presence_of_element_located((self.default_by, locator)))
-                    element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                        EC.element_to_be_clickable((self.default_by, locator)))
+                # Same batching as click_chain_elements: one chained script
+                # per pass, falling back to per-element waits whenever a
+                # pass comes back incomplete.
+                remaining = resolved
+                if steps is not None:
+                    results = self.chain(steps)
+                    if results and all(results):
+                        sleep(pause_time)
+                        continue
+                    if results:
+                        # Clicks before the failing step already ran in the
+                        # browser; finish the pass from there instead of
+                        # replaying them.
+                        remaining = resolved[next(
+                            index for index, ok in enumerate(results) if not ok):]
+                for locator in remaining:
+                    element = self._wait.until(
+                        _clickable(locator))
                     self.click_element(element)
                 sleep(pause_time)
             except Exception as err:
                 self.check_throw(
-                    Error(f"Failed to find element: {locator} and click."))
+                    Error(f"Failed to click chain elements: {locators}. Error:{err}"))
 
     def click_chain_elements(
             self, locators: list, pause_time: int = 0, loop_count: int = 10) -> None:
         try:
-            for _ in range(loop_count):
-                for locator in locators:
-                    WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                        EC.presence_of_element_located((self.default_by, locator)))
-                    element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                        EC.element_to_be_clickable((self.default_by, locator)))
+            start_pass = 0
+            start_step = 0
+            if self.default_by == By.XPATH:
+                # One chained script per pass clicks every element in the
+                # browser (with a DOM settle between clicks) instead of a
+                # wait plus click round-trips per element.
+                steps = [{"op": "click", "xpath": locator}
+                         for locator in locators]
+                batched = True
+                for start_pass in range(loop_count):
+                    results = self.chain(steps)
+                    if not results or not all(results):
+                        # Clicks before the failing step already ran in the
+                        # browser; resume the fallback from that pass and
+                        # step rather than replaying the completed ones.
+                        batched = False
+                        start_step = (next(
+                            index for index, ok in enumerate(results) if not ok)
+                            if results else 0)
+                        break
+                    sleep(pause_time)
+                if batched:
+                    return
+            resolved = [_locator(self.default_by, locator)
+                        for locator in locators]
+            for _ in range(start_pass, loop_count):
+                for locator in resolved[start_step:]:
+                    element = self._wait.until(
+                        _clickable(locator))
                     self.click_element(element)
+                start_step = 0
                 sleep(pause_time)
         except Exception as err:
             self.check_throw(
-                Error(f"Failed to find element: {locator} and click."))
+                Error(f"Failed to click chain elements: {locators}. Error:{err}"))
 
     def click_all_elements_and_scroll(
             self, locator: str, scroll_count=1) -> None:
         try:
-            elements = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_all_elements_located((self.default_by, locator)))
-            for element in elements:
-                WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                    EC.element_to_be_clickable(element))
-                self.click_element(element)
-
-            self.scroll_to_bottom(scroll_count)
+            resolved = _locator(self.default_by, locator)
+            self._wait.until(_all_present(resolved))
+            # Re-find after every scroll and only click the ids not seen
+            # yet: each pass holds one batch of stubs instead of
+            # materializing every match up front, and the first click no
+            # longer waits on the full result set being serialized.
+            processed_ids = set()
+            for _ in range(max(scroll_count, 1)):
+                batch = [
+                    element for element in self.driver.find_elements(*resolved)
+                    if element.id not in processed_ids
+                ]
+                if batch:
+                    # One scripted click loop instead of a clickable wait
+                    # plus an ActionChains round-trip per element
+                    self.driver.execute_script(_CLICK_ALL_JS, batch)
+                    processed_ids.update(element.id for element in batch)
+                self.scroll_to_bottom(1)
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find element: {locator} and click."))
 
     def click_and_wait_for_load(self, locator: str):
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForLoadAfterClick((self.default_by, locator)))
+            self._wait.until(
+                WaitForLoadAfterClick(_locator(self.default_by, locator)))
         except Exception as err:
             print(err)
             self.check_throw(
@@ -957,8 +1585,8 @@ class DriverClient(object):
 
     def click_and_wait_for_element(self, locator: str, locator2: str):
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForElementAfterClick((self.default_by, locator), (self.default_by, locator2)))
+            self._wait.until(
+                WaitForElementAfterClick(_locator(self.default_by, locator), _locator(self.default_by, locator2)))
         except Exception as err:
             print(err)
             self.check_throw(
@@ -966,8 +1594,8 @@ class DriverClient(object):
 
     def click_and_wait_for_html_load(self, locator: str):
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForHtmlLoadAfterClick((self.default_by, locator)))
+            self._wait.until(
+                WaitForHtmlLoadAfterClick(_locator(self.default_by, locator)))
         except Exception as err:
             print(err)
             self.check_throw(
@@ -975,36 +1603,29 @@ class DriverClient(object):
 
     def click_element_and_wait_for_load(self, element: WebElement):
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
+            self._wait.until(
                 EC.element_to_be_clickable(element))
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
+            self._wait.until(
                 WaitForHtmlLoadAfterClickElement(element))
         except Exception as err:
             print(err)
             self.check_throw(
                 Error("Failed to find element and click."))
 
+    @_guarded("Failed to find element: {locator} and click.")
     def wait_for_element(self, locator: str) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and click."))
+        self._until_present(locator)
 
+    @_guarded("Failed to find element: {locator} and click.")
     def wait_to_click_element(self, locator: str, wait: int = 1) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitElementToBeClickable((self.default_by, locator), wait))
-        except Exception as err:
-            self.check_throw(
-                Error(f"Failed to find element: {locator} and click."))
+        self._wait.until(
+            WaitElementToBeClickable(_locator(self.default_by, locator), wait))
 
     def wait_for_element_to_disappear_by_xpath(
             self, locator: str, wait: int = 1) -> None:
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WaitForElementToBeStale((self.default_by, locator), wait))
+            self._wait.until(
+                WaitForElementToBeStale(_locator(self.default_by, locator), wait))
         except Exception as err:
             print()
             self.check_throw(
@@ -1013,55 +1634,103 @@ class DriverClient(object):
     def wait_for_element_to_disappear(
             self, element: str, wait: int = 1) -> None:
         try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
+            self._wait.until(
                 WaitForElementToBeStale(element, wait))
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find element: {element} and click."))
 
+    def _exists_cdp(self, xpath: str) -> bool:
+        """
+        Existence probe over CDP Runtime.evaluate: one devtools command, no
+        Selenium element stub. json.dumps keeps the xpath safe to embed.
+
+        Evaluates in the top document regardless of the WebDriver's current
+        frame, so callers must gate on _frame_depth.
+        """
+        result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": f"!!document.evaluate({json.dumps(xpath)}, document, null, 9, null).singleNodeValue",
+            "returnByValue": True,
+        })
+        return bool(result["result"]["value"])
+
     def element_exists(self, locator: str) -> bool:
         try:
-            return bool(
-                element := WebDriverWait(
-                    self.driver, self.poll_time, poll_frequency=self.poll_frequency
-                ).until(EC.presence_of_element_located((self.default_by, locator)))
-            )
+            # The CDP probe only sees the top document; inside a frame the
+            # find_elements path below answers against the right one.
+            if self.default_by == By.XPATH and not self._frame_depth and hasattr(
+                    self.driver, "execute_cdp_cmd"):
+                return self._exists_cdp(locator)
+            # A zero-timeout probe: a missing element answers in one
+            # round-trip instead of blocking for the full poll_time.
+            previous = self.driver.timeouts.implicit_wait
+            self.driver.implicitly_wait(0)
+            try:
+                return bool(
+                    self.driver.find_elements(self.default_by, locator))
+            finally:
+                self.driver.implicitly_wait(previous)
+        except Exception as err:
+            return False
+
+    def fast_exists(self, locator: str) -> bool:
+        """
+        Non-blocking existence probe for hot loops; assumes the implicit
+        wait is already 0 and skips the toggle element_exists pays.
+        """
+        try:
+            return bool(self.driver.find_elements(self.default_by, locator))
         except Exception as err:
             return False
 
     def click_all_elements(self, locator: str) -> None:
         try:
-            processed_elements = set()
-            elements = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_all_elements_located((self.default_by, locator)))
+            # Dedupe by element id: hashing WebElements can compare remote
+            # element IDs over the wire; the id string is a local check.
+            processed_ids = set()
+            elements = self._until_elements(locator)
             for element in elements:
-                if element in processed_elements:
+                if element.id in processed_ids:
                     continue
-                WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                    EC.element_to_be_clickable(element))
-                action = ActionChains(self.driver)
-                action.move_to_element(element)
-                action.click(element)
-                action.perform()
-                processed_elements.add(element)
-            # elements = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-            #     EC.presence_of_all_elements_located((self.default_by, locator)))
+                self._click_with_bounded_retry(element)
+                processed_ids.add(element.id)
+            # elements = self._wait.until(
+            #     _all_present(_locator(self.default_by, locator)))
             # for element in elements:
-            #     WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
+            #     self._wait.until(
             #         EC.element_to_be_clickable(element))
             #     self.click_element(element)
         except Exception as err:
             self.check_throw(
                 Error(f"Failed to find element: {locator} and click."))
 
+    def click_elements_batch(self, elements: list) -> None:
+        """
+        Clicks several already-located elements with one ActionChains
+        perform, sending a single W3C actions request instead of one
+        move+click round-trip per element.
+
+        Args:
+            elements (list): The WebElements to click, in order.
+
+        Raises:
+            Error: If an exception occurs while performing the batch.
+        """
+        try:
+            if not elements:
+                return
+            action = self._actions()
+            for element in elements:
+                action.move_to_element(element).click(element)
+            action.perform()
+        except Exception as err:
+            self._report(err)
+
     def click_all_elements_and_reload(self, locator: str) -> None:
         try:
-            elements = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_all_elements_located((self.default_by, locator)))
+            elements = self._until_elements(locator)
             for element in elements:
-                WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                    EC.element_to_be_clickable(element))
-                self.click_element(element)
+                self._click_with_bounded_retry(element)
 
             self.driver.refresh()
         except Exception as err:
@@ -1070,13 +1739,39 @@ class DriverClient(object):
 
     ## FRAME FUNCTIONS ##
 
+    @_guarded("Failed to find element: {locator} and switch.")
     def find_frame_switch(self, locator: str) -> None:
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.frame_to_be_available_and_switch_to_it((self.default_by, locator)))
-        except Exception as err:
-            self.check_throw(
-                Error("Failed to find element: {} and switch.".format(locator)))
+        self._wait.until(
+            EC.frame_to_be_available_and_switch_to_it(_locator(self.default_by, locator)))
+        self._frame_depth += 1
+
+    # Window handle reads dominate back-to-back window operations; a short
+    # TTL lets a burst of switches share one round-trip.
+    _HANDLES_TTL = 0.2
+
+    def _get_window_handles(self):
+        """
+        Fetch the current window handles via the WebDriver command.
+
+        Deliberately not CDP: every consumer of this list indexes into
+        it, Target.getTargets makes no ordering guarantee relative to
+        driver.window_handles, and on a shared browser it reports pages
+        from every browser context — so a CDP-derived list can switch to
+        or close the wrong window. The TTL cache above keeps the cost of
+        the HTTP command acceptable for bursts of window operations.
+        """
+        return self.driver.window_handles
+
+    def _window_handles_cached(self):
+        stamp, handles = self._handles_cache
+        now = monotonic()
+        if handles is None or now - stamp > self._HANDLES_TTL:
+            handles = self._get_window_handles()
+            self._handles_cache = (now, handles)
+        return handles
+
+    def _invalidate_window_handles(self):
+        self._handles_cache = (0.0, None)
 
     def get_window_handles(self):
         try:
@@ -1091,79 +1786,115 @@ class DriverClient(object):
             self.check_throw(
                 Error(f"Failed to save current window handle. ERROR: {err}"))
 
-    def find_window_handle_switch_to_it_close_previous(self, index):
-        try:
-            WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WindowHandleToBeAvailableSwitchClosePrevious(index))
-        except Exception as err:
-            self.check_throw(Error(f"Failed to find window index: {index} and switch."))
+    def _close_and_switch(self, target_index: int) -> None:
+        """
+        Close the current window and switch to the handle at target_index
+        using a single handles fetch — no polling between the close and
+        the switch.
+        """
+        handles = self._window_handles_cached()
+        if target_index >= len(handles):
+            raise Error(f"No window handle at index: {target_index}.")
+        self.driver.close()
+        self._invalidate_window_handles()
+        self.driver.switch_to.window(handles[target_index])
 
+    @_guarded("Failed to find window index: {index} and switch.")
+    def find_window_handle_switch_to_it_close_previous(self, index):
+        # Fast path: when the target handle is already open, one fused
+        # close-and-switch replaces the polling condition; the wait only
+        # covers windows that have not appeared yet.
+        if 0 < index < len(self._window_handles_cached()):
+            self._close_and_switch(index)
+            return
+        self._wait.until(
+            WindowHandleToBeAvailableSwitchClosePrevious(index))
+        self._invalidate_window_handles()
+
+    @_guarded("Failed to find window index: {index} and switch.")
     def find_window_handle_switch_to_it(self, index):
-        try:
-            window = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WindowHandleToBeAvailable(index))
-            self.driver.switch_to.window(window)
-        except Exception as err:
-            self.check_throw(Error(f"Failed to find window index: {index} and switch."))
+        window = self._wait.until(
+            WindowHandleToBeAvailable(index))
+        self.driver.switch_to.window(window)
 
     def get_window_handle_id(self, index: int) -> str:
         try:
-            return self.driver.window_handles[index]
+            return self._window_handles_cached()[index]
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def switch_to_latest_window(self) -> None:
         try:
-            window = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                WindowHandleToBeAvailable(len(self.driver.window_handles) - 1))
+            # Fast path: one handles fetch and a direct switch; only fall
+            # into a polling wait when no handle is available yet.
+            handles = self._window_handles_cached()
+            if handles:
+                self.driver.switch_to.window(handles[-1])
+                return
+            window = self._wait.until(WindowHandleToBeAvailable(0))
             self.driver.switch_to.window(window)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def switch_to_first_window(self) -> None:
         try:
-            first_window_index = self.driver.window_handles[0]
-            self.driver.switch_to.window(first_window_index)
+            self.driver.switch_to.window(self._window_handles_cached()[0])
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def close_current_window(self) -> None:
         try:
             self.driver.close()
+            self._invalidate_window_handles()
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def switch_to_parent_frame(self) -> None:
         try:
             self.driver.switch_to.parent_frame()
+            self._frame_depth = max(0, self._frame_depth - 1)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def check_element_for_value_change(self, locator: str, forever=False):
-        if forever:
-            value_changed = not False
-            while value_changed:
-                try:
-                    WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                        WaitForValueToChange((self.default_by, locator)))
-                    value_changed = not True
-                except Exception as err:
-                    self.check_throw(Error(f"ERROR: {err}."))
-        else:
+        try:
+            # The browser reports the first mutation through a
+            # MutationObserver; no WebDriver polling while nothing changes.
+            element = self._until_present(locator)
+            if forever:
+                while not self.driver.execute_async_script(
+                        _VALUE_CHANGE_JS, element, self.poll_time):
+                    pass
+                return
+            if self.driver.execute_async_script(
+                    _VALUE_CHANGE_JS, element, self.poll_time):
+                return
+            # The observer timed out with no mutation; preserve the error
+            # contract of the polling condition this replaced. Reported
+            # outside the try so a raise is not swallowed by the fallback.
+        except Exception:
+            # Fall back to the Python-side polling condition; forever means
+            # one effectively unbounded wait, not a retry loop that
+            # reallocates and re-raises per timeout cycle.
             try:
-                WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                    WaitForValueToChange((self.default_by, locator)))
+                wait = self._wait_for(2 ** 31) if forever else self._wait
+                wait.until(
+                    WaitForValueToChange(_locator(self.default_by, locator)))
             except Exception as err:
-                self.check_throw(Error(f"ERROR: {err}."))
+                self._report(err)
+            return
+        self._report(
+            Error(f"Value of element: {locator} did not change within {self.poll_time}s"))
 
     def check_node_css_property(
             self, locator: str, property: str, search: str, value: str, return_value=False) -> Any:
         try:
-            search_str = re.compile(search)
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
+            search_str = _compile(search)
+            element = self._until_present(locator)
             element_property = element.value_of_css_property(property)
-            if not (match := search_str.findall(element_property)):
+            # search() (not findall) so group(1) works; findall returns a
+            # list which has no .group and raised on every match.
+            if not (match := search_str.search(element_property)):
                 return False
 
             match_str = match.group(1)
@@ -1171,7 +1902,7 @@ class DriverClient(object):
                 return match_str if return_value else True
             return element_property if return_value else False
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def execute_script(self, script: str, return_value=False,
                        node: WebElement = None) -> Any:
@@ -1181,7 +1912,7 @@ class DriverClient(object):
             else:
                 self.driver.execute_script(script)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def execute_async_script(self, script: str, return_value=False) -> Any:
         try:
@@ -1190,101 +1921,131 @@ class DriverClient(object):
             else:
                 self.driver.execute_async_script(script)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
+
+    def get_texts_bulk(self, locators: list) -> list:
+        """
+        Reads the text content of several XPath-located nodes in a single
+        execute_script round-trip.
+
+        Args:
+            locators (list): The XPath expressions to read, in order.
+
+        Returns:
+            list: The textContent per locator (None where no node matched),
+            or None on failure.
+
+        Raises:
+            Error: If an exception occurs while reading the texts.
+        """
+        try:
+            return self.driver.execute_script(_BULK_TEXTS_JS, locators)
+        except Exception as err:
+            self._report(err)
+
+    def get_node_snapshot(self, locator: str, fields: list) -> dict:
+        """
+        Reads several fields from one XPath-located node in a single
+        execute_script round-trip.
+
+        Args:
+            locator (str): The XPath expression locating the node.
+            fields (list): The fields to read — 'innerHTML', 'outerHTML'
+                and 'text' map to the corresponding DOM properties, any
+                other name is read via getAttribute.
+
+        Returns:
+            dict: The requested fields, or None if no node matched or on
+            failure.
+
+        Raises:
+            Error: If an exception occurs while reading the snapshot.
+        """
+        try:
+            return self.driver.execute_script(
+                _NODE_SNAPSHOT_JS, locator, list(fields))
+        except Exception as err:
+            self._report(err)
 
     def get_text_from_node_convert(self, locator: str, ctype: Any) -> Any:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
+            element = self._until_clickable(locator)
             return ctype(element.text)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_text_from_node(self, locator: str) -> str:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
+            element = self._until_clickable(locator)
             return element.text
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_text_from_node_element(self, element: WebElement) -> str:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
+            element = self._wait.until(
                 EC.element_to_be_clickable(element))
             return element.text
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def set_attribute_of_node(
             self, locator: str, attribute: str, value: str) -> None:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            self.execute_script(
-                f"document.evaluate('{
-                    locator}', document, null, locatorResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue.setAttribute('{
-                    attribute}', '{value}')"
-            )
+            element = self._until_present(locator)
+            # Bound arguments reuse the element already located above and
+            # avoid interpolating the xpath (and its quotes) into JS.
+            self.driver.execute_script(
+                _SET_ATTR_JS, element, attribute, value)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def remove_attribute_of_node(self, locator: str, attribute: str) -> None:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
-            self.execute_script(
-                f"document.evaluate('{
-                    locator}', document, null, locatorResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue.removeAttribute('{attribute}');"
-            )
+            element = self._until_present(locator)
+            self.driver.execute_script(_REMOVE_ATTR_JS, element, attribute)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_property_from_node(self, locator: str, attr: str) -> Any:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
+            element = self._until_clickable(locator)
             return element.get_property(attr)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_attribute_from_node(self, locator: str, attr: str) -> Any:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
+            element = self._until_present(locator)
             return element.get_attribute(attr)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_inner_html_from_node(self, locator: str) -> str:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
+            element = self._until_present(locator)
             return element.get_attribute('innerHTML')
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def get_outer_html_from_node(self, locator: str) -> str:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.presence_of_element_located((self.default_by, locator)))
+            element = self._until_present(locator)
             return element.get_attribute('outerHTML')
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def check_node_for_property(self, locator: str, property: str) -> bool:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
+            element = self._until_clickable(locator)
             return bool(element.get_property(property))
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
     def select_option_from_dropdown(
             self, locator: str, select_type: DROPDOWNTYPE, value: Any) -> None:
         try:
-            element = WebDriverWait(self.driver, self.poll_time, poll_frequency=self.poll_frequency).until(
-                EC.element_to_be_clickable((self.default_by, locator)))
+            element = self._until_clickable(locator)
             select = Select(element)
             if select_type == DROPDOWNTYPE.INDEX:
                 select.select_by_index(value)
@@ -1293,11 +2054,11 @@ class DriverClient(object):
             elif select_type == DROPDOWNTYPE.TEXT:
                 select.select_by_visible_text(value)
         except Exception as err:
-            self.check_throw(Error(f"ERROR: {err}."))
+            self._report(err)
 
 
 class AppiumClient(DriverClient):
 
-    def __init__(self, driver: DriverInterface, poll_time: int = 10, poll_frequency: int = 1, scroll_pause_time: int = 5, debug_mode: bool = False, throw: bool = False,
+    def __init__(self, driver: DriverInterface, poll_time: int = 10, poll_frequency: float = 0.1, scroll_pause_time: int = 5, debug_mode: bool = False, throw: bool = False,
                  delete_profile: bool = False, close_previous_sessions: bool = False, action_delay: int = 0, disable_bot_detection_flag: bool = False, default_by: AppiumBy = AppiumBy.IOS_PREDICATE ) -> None:
         super().__init__(driver, poll_time, poll_frequency, scroll_pause_time, debug_mode, throw, delete_profile, close_previous_sessions, action_delay, disable_bot_detection_flag, default_by)
\ No newline at end of file
@@ -1,7 +1,28 @@
 from types import FunctionType
+import os
 import time
 
 
+def _wait_for_condition(driver, condition, timeout):
+    """Poll a condition on the driver, falling back to a fixed sleep when no
+    driver is available (e.g. the wrapped object is not a client)."""
+    if driver is None:
+        time.sleep(timeout)
+        return
+    try:
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        WebDriverWait(driver, timeout).until(condition)
+    except Exception:
+        # Condition never held within the timeout; proceed anyway, matching
+        # the old fixed-delay semantics of "wait at most this long".
+        pass
+
+
+def _document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
 def DelayerMetaClass(
     function,
     timer,
@@ -12,22 +33,66 @@ def DelayerMetaClass(
         "_delete_profile": "",
         "check_throw": "",
     },
+    policy=None,
 ):
+    """``policy`` maps method names to a wrapper factory (e.g.
+    delayed_function_fixed, or no_delay for methods that already wait
+    internally), overriding the class-wide default for those methods."""
 
     class MetaClass(type):
         def __new__(cls, classname, bases, classDict):
             newClassDict = {}
+            wrapper = function
+            if os.getenv("PYLIBSELENIUM_LEGACY_DELAY") == "1":
+                wrapper = delayed_function_fixed
             for attributeName, attribute in classDict.items():
                 if type(attribute) == FunctionType:
                     if attribute.__name__ not in ignore:
-                        attribute = function(attribute, timer)
+                        chosen = (policy or {}).get(
+                            attribute.__name__, wrapper)
+                        attribute = chosen(attribute, timer)
                 newClassDict[attributeName] = attribute
             return type.__new__(cls, classname, bases, newClassDict)
 
     return MetaClass
 
 
+def delay_until(condition, timeout=10):
+    """Decorator for client methods: proceed the moment the condition holds
+    on self.driver instead of sleeping a fixed interval."""
+
+    def decorator(func):
+        def wrapped(self, *args, **kwargs):
+            _wait_for_condition(getattr(self, "driver", None), condition, timeout)
+            return func(self, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
 def delayed_function(func, timer):
+    """Default method wrapper: wait until the document is ready (capped at
+    the configured timer) rather than sleeping the full interval."""
+
+    def wrapped(self, *args, **kwargs):
+        _wait_for_condition(getattr(self, "driver", None), _document_ready, timer)
+        return func(self, *args, **kwargs)
+
+    return wrapped
+
+
+def no_delay(func, timer):
+    """Policy entry for methods that already wait internally (the find_*
+    family runs its own WebDriverWait) — wrapping them again would just
+    double the wait."""
+    return func
+
+
+def delayed_function_fixed(func, timer):
+    """Legacy fixed-sleep wrapper, kept for bisecting behaviour changes
+    (enable with PYLIBSELENIUM_LEGACY_DELAY=1)."""
+
     def wrapped(*args, **kwargs):
         print(f"Delaying for.... {timer}")
         time.sleep(timer)
@@ -1,11 +1,10 @@
-import traceback
-
+import contextlib
+import logging
 
 from .options import BrowserOptions
 from .services import BrowserService
 
 try:
-    import os
     from abc import ABC
     from appium import webdriver as appium_webdriver
     from selenium import webdriver
@@ -13,6 +12,8 @@ except ImportError as err:
     print("Unable to import: {}".format(err))
     exit()
 
+logger = logging.getLogger(__name__)
+
 
 class DriverInterface(ABC):
     def factory(self) -> object:
@@ -21,15 +22,29 @@ class DriverInterface(ABC):
 
 class Chrome(DriverInterface):
 
-    def __init__(self, service: BrowserService, options: BrowserOptions) -> None:
+    def __init__(self, service: BrowserService, options: BrowserOptions, shared_endpoint: str = None) -> None:
         self.service = service
         self.options = options
+        self.shared_endpoint = shared_endpoint
 
     def factory(self) -> object:
         try:
-            return webdriver.Chrome(service=self.service, options=self.options)
-        except Exception as err:
-            traceback.print_exc()
+            if self.shared_endpoint:
+                # Attach to an already-running browser (see shared_browser.py)
+                # instead of spawning a fresh binary.
+                self.options.debugger_address = self.shared_endpoint
+            driver = webdriver.Chrome(service=self.service, options=self.options)
+            if self.shared_endpoint:
+                with contextlib.suppress(Exception):
+                    context = driver.execute_cdp_cmd("Target.createBrowserContext", {})
+                    driver.execute_cdp_cmd(
+                        "Target.createTarget",
+                        {"url": "about:blank", "browserContextId": context["browserContextId"]},
+                    )
+            return driver
+        except Exception:
+            logger.exception("Driver construction failed")
+            raise
 
 
 class Firefox(DriverInterface):
@@ -41,8 +56,9 @@ class Firefox(DriverInterface):
     def factory(self) -> object:
         try:
             return webdriver.Firefox(service=self.service, options=self.options)
-        except Exception as err:
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Driver construction failed")
+            raise
 
 
 class Safari(DriverInterface):
@@ -54,8 +70,9 @@ class Safari(DriverInterface):
     def factory(self) -> object:
         try:
             return webdriver.Safari(service=self.service, options=self.options)
-        except Exception as err:
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Driver construction failed")
+            raise
 
 
 class RemoteWebdriver(DriverInterface):
@@ -64,7 +81,7 @@ class RemoteWebdriver(DriverInterface):
         self,
         remote_url: str,
         options: BrowserOptions = BrowserOptions(),
-        keep_alive: bool = False,
+        keep_alive: bool = True,
     ) -> None:
         self.remote_url = remote_url
         self.options = options
@@ -77,8 +94,9 @@ class RemoteWebdriver(DriverInterface):
                 options=self.options,
                 keep_alive=self.keep_alive,
             )
-        except Exception as err:
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Driver construction failed")
+            raise
 
 class Appium(DriverInterface):
 
@@ -86,7 +104,7 @@ class Appium(DriverInterface):
         self,
         remote_url: str,
         options: BrowserOptions = BrowserOptions(),
-        keep_alive: bool = False,
+        keep_alive: bool = True,
     ) -> None:
         self.remote_url = remote_url
         self.options = options
@@ -99,5 +117,6 @@ class Appium(DriverInterface):
                 options=self.options,
                 keep_alive=self.keep_alive,
             )
-        except Exception as err:
-            traceback.print_exc()
\ No newline at end of file
+        except Exception:
+            logger.exception("Driver construction failed")
+            raise
\ No newline at end of file
@@ -26,6 +26,7 @@ class ChromeOptions(BrowserOptions):
         binary_path: str = None,
         disable_bot_detection_flag: bool = False,
         debug_mode=False,
+        debugger_address: str = None,
     ) -> None:
         self.arguments = arguments
         self.preferences = preferences
@@ -33,6 +34,7 @@ class ChromeOptions(BrowserOptions):
         self.binary_path = binary_path
         self.disable_bot_detection_flag = disable_bot_detection_flag
         self.debug_mode = debug_mode
+        self.debugger_address = debugger_address
 
     def disable_bot_detection(self, options):
         try:
@@ -59,6 +61,8 @@ class ChromeOptions(BrowserOptions):
                 options = self.disable_bot_detection(options)
             if self.debug_mode:
                 options.add_experimental_option("detach", True)
+            if self.debugger_address:
+                options.debugger_address = self.debugger_address
             options.set_capability(
                 "goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"}
             )
@@ -0,0 +1,59 @@
+try:
+    import contextlib
+    import queue
+except ImportError as err:
+    print("Unable to import: {}".format(err))
+    exit()
+
+from .driverinterface import DriverInterface
+
+
+class DriverPool(object):
+    """
+    Pre-creates N drivers from a DriverInterface and hands them out via
+    acquire()/release(), resetting session state between uses instead of
+    re-launching a browser binary per use.
+    """
+
+    def __init__(self, interface: DriverInterface, size: int = 2) -> None:
+        self.interface = interface
+        self.size = size
+        self._drivers = queue.Queue()
+        for _ in range(size):
+            self._drivers.put(interface.factory())
+
+    def acquire(self, timeout: int = None):
+        return self._drivers.get(timeout=timeout)
+
+    def release(self, driver) -> None:
+        try:
+            self.reset(driver)
+        except Exception as err:
+            print(err)
+            # Quit the broken session before replacing it, or the browser
+            # process leaks for the lifetime of the pool.
+            with contextlib.suppress(Exception):
+                driver.quit()
+            driver = self.interface.factory()
+        self._drivers.put(driver)
+
+    def reset(self, driver) -> None:
+        driver.delete_all_cookies()
+        driver.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();"
+        )
+        driver.get("about:blank")
+
+    def shutdown(self) -> None:
+        while not self._drivers.empty():
+            with contextlib.suppress(Exception):
+                self._drivers.get_nowait().quit()
+
+
+@contextlib.contextmanager
+def checkout(pool: DriverPool, timeout: int = None):
+    driver = pool.acquire(timeout=timeout)
+    try:
+        yield driver
+    finally:
+        pool.release(driver)
@@ -1,39 +1,101 @@
-from functools import partial, wraps
+import logging
+from contextvars import ContextVar
+from functools import lru_cache, partial, wraps
 from time import sleep
 
-def retry(retries=3, delay=1):
-    def decorator(func):
-        def newfn(*args, **kwargs):
-            attempt = 0
-            while attempt < retries:
+logger = logging.getLogger(__name__)
+
+# Per-context attempt counter so concurrently retrying tasks never share
+# mutable closure state.
+_attempt = ContextVar("pylibselenium_retry_attempt", default=0)
+
+
+def _backoff_schedule(retries, delay, backoff):
+    return (delay * backoff**i for i in range(retries - 1))
+
+
+@lru_cache(maxsize=None)
+def _build_retry_wrapper(func, exceptions, retries, delay, backoff):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _attempt.set(0)
+        try:
+            for pause in _backoff_schedule(retries, delay, backoff):
                 try:
                     return func(*args, **kwargs)
-                except Exception as err:
-                    sleep(delay)
-                    attempt += 1
-                    return func(*args, **kwargs)
+                except exceptions:
+                    _attempt.set(_attempt.get() + 1)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Retrying %s in %ss (attempt %s/%s)",
+                            func.__name__, pause, _attempt.get(), retries,
+                            exc_info=True,
+                        )
+                    sleep(pause)
             return func(*args, **kwargs)
+        finally:
+            _attempt.reset(token)
 
-        return newfn
+    return wrapper
+
+
+def retry(retries=3, delay=1, backoff=1, exceptions=(Exception,)):
+    def decorator(func):
+        return _build_retry_wrapper(func, tuple(exceptions), retries, delay, backoff)
 
     return decorator
 
 
-def retry_until_successful(f=None, delay=1, log=False):
+# The wrapper cache is shared by every decoration site; re-decorating the
+# same function with the same parameters reuses the existing wrapper.
+retry.cache_info = _build_retry_wrapper.cache_info
+retry.cache_clear = _build_retry_wrapper.cache_clear
+
+
+@lru_cache(maxsize=None)
+def _build_until_successful_wrapper(f, delay, log, predicate):
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        while True:
+            try:
+                result = f(*args, **kwargs)
+                if predicate is None or predicate(result):
+                    return result
+            except Exception:
+                pass
+            if log:
+                print("Retrying in {}".format(delay))
+            sleep(delay)
+
+    return wrapper
+
+
+def retry_until_successful(f=None, delay=1, log=False, predicate=None):
     if f is None:
         return partial(
             retry_until_successful,
             delay=delay,
             log=log,
+            predicate=predicate,
         )
+    return _build_until_successful_wrapper(f, delay, log, predicate)
+
+
+def probe(f=None, retries=3, delay=1, backoff=1):
+    """Value-returning retry variant for functions that signal failure by
+    returning None instead of raising: re-invokes on the backoff schedule
+    and returns None once attempts are exhausted, keeping the hot success
+    path free of exception handling."""
+    if f is None:
+        return partial(probe, retries=retries, delay=delay, backoff=backoff)
+
     @wraps(f)
     def wrapper(*args, **kwargs):
-        while True:
-            try:
-                return f(*args, **kwargs)
-            except Exception as err:
-                if log:
-                    print("Retrying in {}".format(delay))
-                sleep(delay)
+        for pause in _backoff_schedule(retries, delay, backoff):
+            result = f(*args, **kwargs)
+            if result is not None:
+                return result
+            sleep(pause)
         return f(*args, **kwargs)
+
     return wrapper
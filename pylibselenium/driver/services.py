@@ -10,6 +10,11 @@ from selenium.webdriver.chrome.service import Service as CS
 from selenium.webdriver.firefox.service import Service as FS
 from selenium.webdriver.safari.service import Service as SS
 
+# Launch the driver binary as its own process-group leader on POSIX so
+# teardown can signal the whole browser tree with a single os.killpg
+# instead of enumerating processes (see DriverClient._kill_processes).
+_POPEN_KW = {"start_new_session": True} if os.name == "posix" else {}
+
 
 class BrowserService(ABC):
 
@@ -27,7 +32,8 @@ class ChromeService(BrowserService):
 
     def factory(self) -> object:
         try:
-            return CS(executable_path=self.executable_path, log_path=self.log_path)
+            return CS(executable_path=self.executable_path, log_path=self.log_path,
+                      popen_kw=dict(_POPEN_KW))
         except Exception as err:
             print(err)
 
@@ -42,7 +48,8 @@ class FirefoxService(BrowserService):
 
     def factory(self) -> object:
         try:
-            return FS(executable_path=self.executable_path, log_path=self.log_path)
+            return FS(executable_path=self.executable_path, log_path=self.log_path,
+                      popen_kw=dict(_POPEN_KW))
         except Exception as err:
             print(err)
 
@@ -65,6 +72,7 @@ class SafariService(BrowserService):
                 executable_path=self.executable_path,
                 log_path=self.log_path,
                 quiet=self.quiet,
+                popen_kw=dict(_POPEN_KW),
             )
         except Exception as err:
             print(err)
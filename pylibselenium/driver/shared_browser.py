@@ -0,0 +1,57 @@
+try:
+    import atexit
+    import contextlib
+    import shutil
+    import subprocess
+    import tempfile
+    from typing import List
+except ImportError as err:
+    print("Unable to import: {}".format(err))
+    exit()
+
+_SHARED_BROWSERS = {}
+
+
+def _cleanup(port: int, user_data_dir: str) -> None:
+    process = _SHARED_BROWSERS.pop(port, None)
+    if process is not None:
+        with contextlib.suppress(Exception):
+            process.terminate()
+            process.wait(timeout=5)
+        with contextlib.suppress(Exception):
+            process.kill()
+    shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+def launch_shared_chrome(
+    port: int = 9222,
+    binary_path: str = "google-chrome",
+    arguments: List[str] = [],
+) -> str:
+    """
+    Start (or reuse) one Chrome process with remote debugging enabled and
+    return its debugger endpoint ("host:port"). Multiple DriverInterface
+    instances can attach to the endpoint instead of spawning their own
+    browser process. The process is cleaned up at interpreter exit.
+    """
+    try:
+        process = _SHARED_BROWSERS.get(port)
+        if process is not None and process.poll() is None:
+            return f"127.0.0.1:{port}"
+
+        user_data_dir = tempfile.mkdtemp(prefix="pylibselenium-shared-")
+        command = [
+            binary_path,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ] + list(arguments)
+        process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        _SHARED_BROWSERS[port] = process
+        atexit.register(_cleanup, port, user_data_dir)
+        return f"127.0.0.1:{port}"
+    except Exception as err:
+        print(err)
@@ -1,18 +1,70 @@
 import logging
 import random
+import time
 from time import sleep
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "AdaptiveWait",
+    "PresenceOfAllElementsLocatedIfNotEmpty",
+    "WaitElementToBeClickable",
+    "WaitForElementAfterClick",
+    "WaitForElementReadyState",
+    "WaitForElementToBeRemoved",
+    "WaitForElementToBeStale",
+    "WaitForHtmlLoadAfterClick",
+    "WaitForHtmlLoadAfterClickElement",
+    "WaitForKeysVerification",
+    "WaitForKeysVerificationWithDelay",
+    "WaitForLoadAfter",
+    "WaitForLoadAfterClick",
+    "WaitForPageLoad",
+    "WaitForValueToChange",
+    "WebDriverWait",
+    "WindowHandleToBeAvailable",
+    "WindowHandleToBeAvailableSwitchClosePrevious",
+]
+
+
+class AdaptiveWait(WebDriverWait):
+    """WebDriverWait that polls with exponential backoff (5ms doubling up to
+    the configured poll frequency) so short waits resolve within
+    milliseconds while long waits settle into the normal poll interval."""
+
+    def until(self, method, message=""):
+        screen = None
+        stacktrace = None
+        delay = 0.005
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            if time.monotonic() > end_time:
+                break
+            sleep(delay)
+            delay = min(delay * 2, self._poll)
+        raise TimeoutException(message, screen, stacktrace)
+
 
 class PresenceOfAllElementsLocatedIfNotEmpty:
-    """Check if elements located by the locator are present and not empty."""
+    """Check if elements located by the locator are present and not empty.
+
+    Returns a non-empty list of elements or False — never any other
+    truthy value, so callers can rely on ``elements or False``."""
 
     def __init__(self, locator):
         self.locator = locator
@@ -243,7 +295,10 @@ class WaitForElementAfterClick:
 
 
 class WaitForKeysVerification:
-    """Wait for keys to be sent to an element and verify."""
+    """Wait for keys to be sent to an element and verify.
+
+    Accepts a locator tuple or an already-located WebElement; passing the
+    element skips the find_element round-trip on every poll."""
 
     def __init__(self, locator, keys, max_length_fallback=None):
         self.locator = locator
@@ -288,7 +343,10 @@ class WaitForKeysVerification:
 
     def __call__(self, driver):
         try:
-            element = driver.find_element(*self.locator)
+            if isinstance(self.locator, WebElement):
+                element = self.locator
+            else:
+                element = driver.find_element(*self.locator)
             if not self.max_length_set:
                 self.set_max_length(element)
             element.click()
@@ -301,7 +359,10 @@ class WaitForKeysVerification:
 
 
 class WaitForKeysVerificationWithDelay:
-    """Wait for keys to be sent to an element with a delay and verify."""
+    """Wait for keys to be sent to an element with a delay and verify.
+
+    Accepts a locator tuple or an already-located WebElement; passing the
+    element skips the find_element round-trip on every poll."""
 
     def __init__(self, locator, keys, delay, max_length_fallback=None):
         self.locator = locator
@@ -347,12 +408,15 @@ class WaitForKeysVerificationWithDelay:
         
     def __call__(self, driver):
         try:
-            element = driver.find_element(*self.locator)
+            if isinstance(self.locator, WebElement):
+                element = self.locator
+            else:
+                element = driver.find_element(*self.locator)
             if not self.max_length_set:
                 self.set_max_length(element)
             element.click()
             element.clear()
-            
+
             # Optimized: Build action chain once and perform once
             action = ActionChains(driver)
             for key in self.keys: